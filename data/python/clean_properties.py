@@ -2,7 +2,7 @@ import os
 import sys
 import logging
 from dotenv import load_dotenv
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 from utils import clean_document
 
 # Load environment variables
@@ -22,21 +22,33 @@ except Exception as e:
     logging.error("Error connecting to MongoDB: %s", e)
     sys.exit(1)
 
+# Number of updates sent to MongoDB per bulk_write round trip.
+UPDATE_BATCH_SIZE = 500
+
 
 def clean_properties():
     try:
-        docs = list(properties_collection.find({}))
-        total_docs = len(docs)
+        total_docs = properties_collection.estimated_document_count()
         logging.info(f"Found {total_docs} documents.")
         updated_count = 0
-
-        for doc in docs:
+        pending = []
+
+        def flush():
+            nonlocal updated_count
+            result = properties_collection.bulk_write(pending, ordered=False)
+            updated_count += result.modified_count
+            pending.clear()
+            logging.info(f"{updated_count} documents updated so far.")
+
+        # Stream the cursor rather than materializing every document up front,
+        # and batch the updates instead of one round trip per document.
+        for doc in properties_collection.find({}):
             cleaned = clean_document(doc)
-            result = properties_collection.update_one({"_id": doc["_id"]}, {"$set": cleaned})
-            if result.modified_count:
-                updated_count += 1
-                if updated_count % 100 == 0:
-                    logging.info(f"{updated_count} documents updated so far.")
+            pending.append(UpdateOne({"_id": doc["_id"]}, {"$set": cleaned}))
+            if len(pending) >= UPDATE_BATCH_SIZE:
+                flush()
+        if pending:
+            flush()
         logging.info(f"Data cleaning completed. Total updated: {updated_count} documents.")
     except Exception as err:
         logging.error("Error during cleaning: %s", err)
@@ -1,5 +1,6 @@
 import os
 import sys
+import argparse
 import logging
 from dotenv import load_dotenv
 from pymongo import MongoClient
@@ -23,37 +24,69 @@ except Exception as e:
     sys.exit(1)
 
 
-def compute_summary():
-    prices = []
+def _quantiles(values, qs):
+    """
+    Linear-interpolated percentiles (same as np.percentile's default) from a
+    single np.partition call shared by all requested percentiles, instead of
+    one partition per np.percentile/np.median call.
+    """
+    pos = np.asarray(qs, dtype=np.float64) / 100 * (values.size - 1)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.ceil(pos).astype(np.intp)
+    part = np.partition(values, np.union1d(np.union1d(lo, hi), [0, values.size - 1]))
+    # np.partition puts -inf first and inf/NaN last. For non-finite data, use
+    # the plain NumPy reductions so NaN and inf come out exactly as before.
+    if not (np.isfinite(part[0]) and np.isfinite(part[-1])):
+        exact = {0: np.min, 50: np.median, 100: np.max}
+        return np.array([exact[q](values) if q in exact else np.percentile(values, q) for q in qs])
+    return part[lo] + (part[hi] - part[lo]) * (pos - lo)
+
+
+def compute_summary(include_cities=True):
+    """
+    Prints overall price statistics and, unless include_cities is False, the
+    per-city breakdown (which also skips fetching and grouping the city field).
+    """
+    # Each price is stored once: in its city's list, or in ungrouped_prices when
+    # the city cannot be used as a key. The overall column is their concatenation
+    # (the overall stats do not depend on order).
+    ungrouped_prices = []
     total_count = 0
-    city_stats = defaultdict(lambda: {"prices": [], "count": 0})
+    city_prices = defaultdict(list)
+    projection = {"price": 1, "city": 1} if include_cities else {"price": 1}
 
-    for prop in properties_collection.find({}, {"price": 1, "city": 1}):
+    for prop in properties_collection.find({}, projection):
         total_count += 1
         price_val = prop.get("price", 0)
         try:
             price = float(price_val)
-            prices.append(price)
-            # Group by city (use "Unknown" if city field is missing or empty)
-            city = prop.get("city") or "Unknown"
-            city_stats[city]["prices"].append(price)
-            city_stats[city]["count"] += 1
         except (ValueError, TypeError):
             continue
+        if not include_cities:
+            ungrouped_prices.append(price)
+            continue
+        try:
+            # Group by city (use "Unknown" if city field is missing or empty)
+            city_prices[prop.get("city") or "Unknown"].append(price)
+        except TypeError:
+            # An unhashable city is left out of the breakdown but still counts
+            # towards the overall stats.
+            ungrouped_prices.append(price)
+
+    city_arrays = {city: np.array(p, dtype=np.float64) for city, p in city_prices.items()}
+    prices_array = np.concatenate([np.array(ungrouped_prices, dtype=np.float64), *city_arrays.values()])
 
     print("Overall Property Summary:")
     print("-------------------------")
     print(f"Total properties: {total_count}")
 
-    if prices:
-        prices_array = np.array(prices)
-        avg_price = np.mean(prices_array)
-        median_price = np.median(prices_array)
-        std_price = np.std(prices_array)
-        min_price = np.min(prices_array)
-        max_price = np.max(prices_array)
-        perc_25 = np.percentile(prices_array, 25)
-        perc_75 = np.percentile(prices_array, 75)
+    if prices_array.size:
+        # One partition serves the median and the quartiles, and the mean is
+        # computed once and reused for the standard deviation.
+        avg_price = prices_array.sum() / prices_array.size
+        dev = prices_array - avg_price
+        std_price = np.sqrt(np.dot(dev, dev) / prices_array.size)
+        min_price, perc_25, median_price, perc_75, max_price = _quantiles(prices_array, [0, 25, 50, 75, 100])
 
         print(f"Average price   : ${avg_price:,.2f}")
         print(f"Median price    : ${median_price:,.2f}")
@@ -64,29 +97,36 @@ def compute_summary():
     else:
         print("No valid price data found.")
 
+    if not include_cities:
+        return
+
     print("\nProperty Summary by City:")
     print("-------------------------")
-    for city, stats in city_stats.items():
-        count = stats["count"]
-        if stats["prices"]:
-            city_prices = np.array(stats["prices"])
-            avg = np.mean(city_prices)
-            med = np.median(city_prices)
-            std = np.std(city_prices)
-            mini = np.min(city_prices)
-            maxi = np.max(city_prices)
-            print(f"City: {city}")
-            print(f"  Count           : {count}")
-            print(f"  Avg Price       : ${avg:,.2f}")
-            print(f"  Median Price    : ${med:,.2f}")
-            print(f"  Price Range     : ${mini:,.2f} - ${maxi:,.2f}")
-            print(f"  Std Deviation   : ${std:,.2f}")
-        else:
-            print(f"City: {city} has no valid price data.")
+    for city, city_prices_array in city_arrays.items():
+        # Same as the overall stats: one partition per city, mean reused for std.
+        count = city_prices_array.size
+        avg = city_prices_array.sum() / count
+        dev = city_prices_array - avg
+        std = np.sqrt(np.dot(dev, dev) / count)
+        mini, med, maxi = _quantiles(city_prices_array, [0, 50, 100])
+        print(f"City: {city}")
+        print(f"  Count           : {count}")
+        print(f"  Avg Price       : ${avg:,.2f}")
+        print(f"  Median Price    : ${med:,.2f}")
+        print(f"  Price Range     : ${mini:,.2f} - ${maxi:,.2f}")
+        print(f"  Std Deviation   : ${std:,.2f}")
         print()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize property prices stored in MongoDB.")
+    parser.add_argument(
+        "--overall-only",
+        action="store_true",
+        help="Only print the overall summary; skip the per-city breakdown.",
+    )
+    args = parser.parse_args()
+
     logging.basicConfig(level=logging.INFO)
-    compute_summary()
+    compute_summary(include_cities=not args.overall_only)
     client.close()
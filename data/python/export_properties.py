@@ -22,7 +22,6 @@ def export_properties_to_csv(filename):
     """
     Exports all property documents to a CSV file.
     """
-    cursor = properties_collection.find({})
     fieldnames = [
         "zpid",
         "city",
@@ -40,15 +39,18 @@ def export_properties_to_csv(filename):
         "listingDataSource",
         "description"
     ]
+    # Fetch only the exported fields so documents can be written as-is.
+    projection = {"_id": 0, **{k: 1 for k in fieldnames}}
+    cursor = properties_collection.find({}, projection)
 
     with open(filename, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, restval="", extrasaction="ignore")
         writer.writeheader()
         for doc in cursor:
             # Convert 'address' from dict to string if necessary.
             if "address" in doc and isinstance(doc["address"], dict):
                 doc["address"] = str(doc["address"])
-            writer.writerow({k: doc.get(k, "") for k in fieldnames})
+            writer.writerow(doc)
 
     print(f"Data exported successfully to {filename}")
 
@@ -1,6 +1,7 @@
 import os
 import sys
 import csv
+import itertools
 import logging
 from dotenv import load_dotenv
 from pymongo import MongoClient
@@ -26,23 +27,26 @@ CSV_FILE = "properties_sync.csv"
 
 def sync_to_csv():
     try:
-        properties = list(properties_collection.find({}))
-        if not properties:
+        # Stream the cursor; the header comes from the first document.
+        cursor = properties_collection.find({})
+        first = next(cursor, None)
+        if first is None:
             logging.info("No properties found in the database.")
             return
 
+        synced_count = 0
         with open(CSV_FILE, "w", newline="", encoding="utf-8") as csvfile:
-            # Get header keys from the first document
-            header = sorted(properties[0].keys())
+            header = sorted(first.keys())
             writer = csv.DictWriter(csvfile, fieldnames=header)
             writer.writeheader()
 
-            for prop in properties:
+            for prop in itertools.chain([first], cursor):
                 # Convert _id to str for CSV compatibility
                 if "_id" in prop:
                     prop["_id"] = str(prop["_id"])
                 writer.writerow(prop)
-        logging.info(f"Synced {len(properties)} properties to {CSV_FILE}")
+                synced_count += 1
+        logging.info(f"Synced {synced_count} properties to {CSV_FILE}")
     except Exception as err:
         logging.error("Error during sync: %s", err)
     finally:
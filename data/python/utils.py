@@ -4,9 +4,8 @@ from datetime import datetime
 
 
 def safe_str(val, fallback="Unknown"):
-    if isinstance(val, str) and val.strip():
-        return val.strip()
-    return fallback
+    s = val.strip() if isinstance(val, str) else ""
+    return s or fallback
 
 
 def safe_num(val, fallback=0, min_val=None, max_val=None):
@@ -26,15 +25,21 @@ def clean_document(doc):
         year_built = 0
 
     address = doc.get("address", {})
+    # Strip each city/state source once; the top-level and address fields
+    # only differ in which source takes precedence.
+    doc_city = safe_str(doc.get("city"), "")
+    addr_city = safe_str(address.get("city"), "")
+    doc_state = safe_str(doc.get("state"), "")
+    addr_state = safe_str(address.get("state"), "")
     return {
         "zpid": safe_num(doc.get("zpid"), 0),
-        "city": safe_str(doc.get("city"), "") or safe_str(address.get("city"), "Unknown"),
-        "state": safe_str(doc.get("state"), "") or safe_str(address.get("state"), "Unknown"),
+        "city": doc_city or addr_city or "Unknown",
+        "state": doc_state or addr_state or "Unknown",
         "homeStatus": safe_str(doc.get("homeStatus")),
         "address": {
             "streetAddress": safe_str(address.get("streetAddress"), safe_str(doc.get("streetAddress"), "Unknown")),
-            "city": safe_str(address.get("city"), safe_str(doc.get("city"), "Unknown")),
-            "state": safe_str(address.get("state"), safe_str(doc.get("state"), "Unknown")),
+            "city": addr_city or doc_city or "Unknown",
+            "state": addr_state or doc_state or "Unknown",
             "zipcode": safe_str(address.get("zipcode"), safe_str(doc.get("zipcode"), "Unknown")),
             "neighborhood": address.get("neighborhood"),
             "community": address.get("community"),